@@ -1 +1,4 @@
-from rationals.approximation import best_rational_approximation
+from rationals.approximation import (
+    best_rational_approximation,
+    best_rational_approximation_batch,
+)
@@ -0,0 +1,129 @@
+"""Optional numba-accelerated kernels for the approximation algorithms.
+
+numba is an optional dependency (install with the "jit" extra): importing this
+module never requires it. When numba is missing, the kernel names below are set
+to None and callers fall back to the pure-Python implementations. The kernels
+work on int64 state, so they also signal overflow back to the caller, which
+then falls back to Python's arbitrary-precision ints.
+"""
+import math
+
+try:
+    from numba import njit
+except ImportError:  # pragma: no cover - numba is optional
+    njit = None
+
+# denominators beyond this would overflow intermediate int64 products,
+# so the kernels bail out and the caller retries with Python ints
+_I64_LIMIT = 2 ** 60
+
+farey_accuracy_i64 = None
+convergent_i64 = None
+
+
+if njit is not None:
+
+    @njit(cache=True)
+    def farey_accuracy_i64(x, eps):  # noqa: F811
+        """int64 mirror of the batched Stern-Brocot descent in
+        rationals.approximation._farey_algorithm_accuracy.
+
+        Returns (numerator, denominator), or (0, -1) when the descent would
+        overflow int64 and the caller should use the pure-Python path.
+        """
+        if x < eps:
+            return 0, 1
+        inv = 1.0 / x
+        # for very small x (large places) the reciprocal itself may not fit
+        # int64; convert only once that is known to be safe
+        if inv > _I64_LIMIT:
+            return 0, -1
+        la, lb = 0, 1
+        ra, rb = 1, int(inv)
+        if abs(x * rb - ra) < eps * rb:
+            return ra, rb
+
+        while True:
+            ma, mb = la + ra, lb + rb
+            if mb > _I64_LIMIT:
+                return 0, -1
+            diff = x * mb - ma
+            if abs(diff) < eps * mb:
+                return ma, mb
+            if diff < 0:
+                ra, rb = ma, mb
+                u = x * lb - la
+                v = ra - x * rb
+                if u <= 0:
+                    continue
+                kf = math.ceil(v / u)
+                # guard the float->int conversion itself, then the advanced
+                # denominator, dividing so the check cannot overflow either
+                if kf > _I64_LIMIT or int(kf) - 1 > (_I64_LIMIT - rb) // lb:
+                    return 0, -1
+                k = max(int(kf) - 1, 0)
+                while k > 0 and x * (k * lb + rb) >= k * la + ra:
+                    k -= 1
+                # the i estimate has a smaller numerator and larger denominator
+                # than v / u, so it is bounded by kf and needs no extra guard
+                i = max(int(math.floor((v - eps * rb) / (u + eps * lb))) + 1, 1)
+                while i > 1:
+                    pa, pb = (i - 1) * la + ra, (i - 1) * lb + rb
+                    if abs(x * pb - pa) >= eps * pb:
+                        break
+                    i -= 1
+                while i <= k and not abs(x * (i * lb + rb) - (i * la + ra)) < eps * (i * lb + rb):
+                    i += 1
+                if i <= k:
+                    return i * la + ra, i * lb + rb
+                elif k > 0:
+                    ra, rb = k * la + ra, k * lb + rb
+            else:
+                la, lb = ma, mb
+                u = x * lb - la
+                v = ra - x * rb
+                if v <= 0:
+                    continue
+                kf = math.ceil(u / v)
+                if kf > _I64_LIMIT or int(kf) - 1 > (_I64_LIMIT - lb) // rb:
+                    return 0, -1
+                k = max(int(kf) - 1, 0)
+                while k > 0 and x * (lb + k * rb) <= la + k * ra:
+                    k -= 1
+                i = max(int(math.floor((u - eps * lb) / (v + eps * rb))) + 1, 1)
+                while i > 1:
+                    pa, pb = la + (i - 1) * ra, lb + (i - 1) * rb
+                    if abs(x * pb - pa) >= eps * pb:
+                        break
+                    i -= 1
+                while i <= k and not abs(x * (lb + i * rb) - (la + i * ra)) < eps * (lb + i * rb):
+                    i += 1
+                if i <= k:
+                    return la + i * ra, lb + i * rb
+                elif k > 0:
+                    la, lb = la + k * ra, lb + k * rb
+
+    @njit(cache=True)
+    def convergent_i64(x, n):  # noqa: F811
+        """int64 mirror of truncated_continued_fraction(x, n).as_rational,
+        fusing the Gauss map with the convergent recurrence.
+
+        Returns (numerator, denominator), or (0, -1) when the recurrence would
+        overflow int64 and the caller should use the pure-Python path.
+        """
+        a = int(math.floor(x))
+        p_prev, q_prev = 1, 0
+        p, q = a, 1
+        frac = x - a
+        count = 1
+        while count <= n and frac != 0:
+            remainder = 1.0 / frac
+            a = int(remainder)
+            frac = remainder - a
+            # a >= 1 here, so guard the upcoming products against overflow
+            if abs(p) > _I64_LIMIT // a or q > _I64_LIMIT // a:
+                return 0, -1
+            p_prev, p = p, a * p + p_prev
+            q_prev, q = q, a * q + q_prev
+            count += 1
+        return p, q
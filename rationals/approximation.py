@@ -1,9 +1,13 @@
 import math
 
+from rationals._jit import farey_accuracy_i64
 from rationals.data import truncated_continued_fraction, Rational
-from rationals.utils import almost_equal
+from rationals.utils import almost_equal_rational
 
 ALLOWED_METHODS = ["farey", "continued_fraction"]
+# membership is checked on every call, so test against a frozenset; the list
+# above stays public (and ordered) for the error message and for callers
+_ALLOWED_METHODS = frozenset(ALLOWED_METHODS)
 
 
 def farey_add(x: Rational, y: Rational) -> Rational:
@@ -11,40 +15,214 @@ def farey_add(x: Rational, y: Rational) -> Rational:
     return Rational(x.numerator + y.numerator, x.denominator + y.denominator)
 
 
+# the approximation is a pure function of its arguments, so results are memoized
+# in a plain dict; a dict beats functools.lru_cache here because hits skip the
+# LRU bookkeeping, and the cache is simply flushed wholesale if it grows too large
+_CACHE = {}
+_CACHE_MAX_SIZE = 100_000
+
+
 def best_rational_approximation(x, method="farey", places=None, max_denominator=None):
     """Find a rational approximation of x to the specified number of decimal places.
 
     We use an algorithm based on the Farey sequence, which consists of all completely
     reduced fractions between 0 and 1. This ensures that the rational approximation
     found by the algorithm is completely reduced.
+
+    Results are cached, so repeated requests for the same arguments are free.
+    """
+    key = (x, method, places, max_denominator)
+    result = _CACHE.get(key)
+    if result is None:
+        result = _best_rational_approximation(x, method, places, max_denominator)
+        if len(_CACHE) >= _CACHE_MAX_SIZE:
+            _CACHE.clear()
+        _CACHE[key] = result
+    return result
+
+
+def _reduce(x):
+    """Reduce x to the core range [0, 0.5] in a single pass.
+
+    Returns (sign, integer_part, flipped, core) such that the original value is
+    recovered as sign * (integer_part + core), with core complemented to
+    1 - core when flipped is True. The core algorithms then only ever see the
+    range where the Farey walk between 0/1 and 1/N applies.
     """
+    sign = 1
+    if x < 0:
+        sign = -1
+        x = -x
+    integer_part = int(x // 1)
+    x = x % 1
+    flipped = False
+    if 0.5 < x < 1:
+        flipped = True
+        x = 1 - x
+    return sign, integer_part, flipped, x
+
+
+def _best_rational_approximation(x, method, places, max_denominator):
+    sign, integer_part, flipped, x = _reduce(x)
+
     if x == 0:
-        return Rational(0, 1)
-    elif x < 0:
-        return -best_rational_approximation(-x, method, places, max_denominator)
-    elif x >= 1:
-        return int(x // 1) + best_rational_approximation(
-            x % 1, method, places, max_denominator
-        )
-    elif 0.5 < x < 1:
-        return 1 - best_rational_approximation(1 - x, method, places, max_denominator)
-
-    if method == "farey":
-        if places is not None and max_denominator is None:
-            return _farey_algorithm_accuracy(x, places)
-        if places is None and max_denominator is not None:
-            return _farey_algorithm_denominator(x, max_denominator)
-        else:
-            raise ValueError("must specify one of places or max_denominator")
-    elif method == "continued_fraction":
-        if places is not None and max_denominator is None:
-            return _continued_fraction_algorithm_accuracy(x, places)
-        elif places is None and max_denominator is not None:
-            return _continued_fraction_algorithm_denominator(x, max_denominator)
-        else:
-            raise ValueError("must specify one of places or max_denominator")
-    else:
+        result = Rational.ZERO
+    elif method not in _ALLOWED_METHODS:
         raise ValueError("method should be one of %s" % ALLOWED_METHODS)
+    elif places is not None and max_denominator is None:
+        result = _ACCURACY_ALGORITHMS[method](x, places)
+    elif places is None and max_denominator is not None:
+        result = _DENOMINATOR_ALGORITHMS[method](x, max_denominator)
+    else:
+        raise ValueError("must specify one of places or max_denominator")
+
+    if flipped:
+        result = 1 - result
+    if integer_part:
+        result = integer_part + result
+    if sign < 0:
+        result = -result
+    return result
+
+
+def best_rational_approximation_batch(xs, places=7):
+    """Find rational approximations for an array of values in one vectorized pass.
+
+    This is the array counterpart of best_rational_approximation with the "farey"
+    method and the places kwarg: rather than paying the Python dispatch cost once
+    per element, all elements walk the Stern-Brocot tree in lockstep on int64
+    NumPy arrays, with per-element masks tracking which entries are finished.
+
+    Returns a pair of int64 arrays (numerators, denominators). Requires numpy,
+    which is an optional dependency (install with the "batch" extra).
+    """
+    import numpy as np
+
+    xs = np.asarray(xs, dtype=np.float64)
+    eps = 0.5 * 10 ** -places
+
+    # same argument reduction as the scalar path: strip sign and integer part,
+    # and complement values above one half, leaving the core range [0, 0.5]
+    signs = np.where(xs < 0, -1, 1)
+    integer_parts = np.floor(np.abs(xs)).astype(np.int64)
+    core = np.abs(xs) - np.floor(np.abs(xs))
+    flipped = core > 0.5
+    core = np.where(flipped, 1 - core, core)
+
+    numerators = np.zeros(core.shape, dtype=np.int64)
+    denominators = np.ones(core.shape, dtype=np.int64)
+
+    la = np.zeros(core.shape, dtype=np.int64)
+    lb = np.ones(core.shape, dtype=np.int64)
+    ra = np.ones(core.shape, dtype=np.int64)
+    rb = np.ones(core.shape, dtype=np.int64)
+
+    # entries within eps of zero are done already as 0/1
+    active = core >= eps
+    rb[active] = np.floor(1 / core[active]).astype(np.int64)
+    hit = active & (np.abs(core * rb - 1) < eps * rb)
+    numerators[hit] = 1
+    denominators[hit] = rb[hit]
+    active &= ~hit
+
+    while active.any():
+        ma = la + ra
+        mb = lb + rb
+        diff = core * mb - ma
+        done = active & (np.abs(diff) < eps * mb)
+        numerators[done] = ma[done]
+        denominators[done] = mb[done]
+        active &= ~done
+        below = active & (diff < 0)
+        above = active & (diff > 0)
+        ra[below] = ma[below]
+        rb[below] = mb[below]
+        la[above] = ma[above]
+        lb[above] = mb[above]
+
+        # collapse the rest of each same-side run in closed form, mirroring the
+        # scalar walk: with u = core*lb - la and v = ra - core*rb, successive
+        # right-run mediants are (i*la + ra) / (i*lb + rb), the run keeps going
+        # while i*u < v, and the tolerance is first met near the closed-form
+        # index; the same +-1 verification loops as the scalar code run here as
+        # masked passes, so each element returns the exact fraction the scalar
+        # path would. Without this, one long run would stall the whole batch
+        # on O(denominator) full-array passes.
+        u = core * lb - la
+        v = ra - core * rb
+
+        run = below & (u > 0)
+        if run.any():
+            k = np.zeros_like(la)
+            i = np.ones_like(la)
+            k[run] = np.maximum(np.ceil(v[run] / u[run]).astype(np.int64) - 1, 0)
+            over = run & (k > 0) & (core * (k * lb + rb) >= k * la + ra)
+            while over.any():
+                k[over] -= 1
+                over = run & (k > 0) & (core * (k * lb + rb) >= k * la + ra)
+            i[run] = np.maximum(
+                np.floor((v[run] - eps * rb[run]) / (u[run] + eps * lb[run])).astype(np.int64) + 1,
+                1,
+            )
+            pa, pb = (i - 1) * la + ra, (i - 1) * lb + rb
+            down = run & (i > 1) & (np.abs(core * pb - pa) < eps * pb)
+            while down.any():
+                i[down] -= 1
+                pa, pb = (i - 1) * la + ra, (i - 1) * lb + rb
+                down = run & (i > 1) & (np.abs(core * pb - pa) < eps * pb)
+            pa, pb = i * la + ra, i * lb + rb
+            up = run & (i <= k) & ~(np.abs(core * pb - pa) < eps * pb)
+            while up.any():
+                i[up] += 1
+                pa, pb = i * la + ra, i * lb + rb
+                up = run & (i <= k) & ~(np.abs(core * pb - pa) < eps * pb)
+            hit = run & (i <= k)
+            numerators[hit] = pa[hit]
+            denominators[hit] = pb[hit]
+            active &= ~hit
+            advance = run & ~hit & (k > 0)
+            ra[advance] = (k * la + ra)[advance]
+            rb[advance] = (k * lb + rb)[advance]
+
+        run = above & (v > 0)
+        if run.any():
+            # mirror image: left-run mediants are (la + i*ra) / (lb + i*rb)
+            # and the run keeps going while i*v < u
+            k = np.zeros_like(la)
+            i = np.ones_like(la)
+            k[run] = np.maximum(np.ceil(u[run] / v[run]).astype(np.int64) - 1, 0)
+            over = run & (k > 0) & (core * (lb + k * rb) <= la + k * ra)
+            while over.any():
+                k[over] -= 1
+                over = run & (k > 0) & (core * (lb + k * rb) <= la + k * ra)
+            i[run] = np.maximum(
+                np.floor((u[run] - eps * lb[run]) / (v[run] + eps * rb[run])).astype(np.int64) + 1,
+                1,
+            )
+            pa, pb = la + (i - 1) * ra, lb + (i - 1) * rb
+            down = run & (i > 1) & (np.abs(core * pb - pa) < eps * pb)
+            while down.any():
+                i[down] -= 1
+                pa, pb = la + (i - 1) * ra, lb + (i - 1) * rb
+                down = run & (i > 1) & (np.abs(core * pb - pa) < eps * pb)
+            pa, pb = la + i * ra, lb + i * rb
+            up = run & (i <= k) & ~(np.abs(core * pb - pa) < eps * pb)
+            while up.any():
+                i[up] += 1
+                pa, pb = la + i * ra, lb + i * rb
+                up = run & (i <= k) & ~(np.abs(core * pb - pa) < eps * pb)
+            hit = run & (i <= k)
+            numerators[hit] = pa[hit]
+            denominators[hit] = pb[hit]
+            active &= ~hit
+            advance = run & ~hit & (k > 0)
+            la[advance] = (la + k * ra)[advance]
+            lb[advance] = (lb + k * rb)[advance]
+
+    # undo the argument reduction on the int64 results
+    numerators = np.where(flipped, denominators - numerators, numerators)
+    numerators = signs * (numerators + integer_parts * denominators)
+    return numerators, denominators
 
 
 def _farey_algorithm_accuracy(x, places=7):
@@ -57,27 +235,89 @@ def _farey_algorithm_accuracy(x, places=7):
     To speed up the process for small x, note that we only need to look in the range between
     (0, 1) and (1, N), for N = math.floor(1 / x), since we will always reach this region
     eventually by repeated Farey addition.
+
+    Rather than taking one mediant step per iteration, we batch consecutive steps on the
+    same side of x, computing the length of each run in closed form with math.floor. This
+    collapses O(N) iterations to O(log N), as in the Euclidean algorithm.
+
+    The endpoints are kept as plain (numerator, denominator) int pairs throughout; a
+    Rational is only constructed for the returned value, so the hot loop allocates no
+    objects at all.
+    When numba is installed, the descent runs as a jitted int64 kernel; it reports
+    back if the denominators would overflow int64, in which case we rerun the search
+    below on Python's arbitrary-precision ints.
     """
+    eps = 0.5 * 10 ** -places
 
-    left = Rational(0, 1)
-    right = Rational(1, math.floor(1 / x))
-    if almost_equal(x, left, places):
-        return left
-    elif almost_equal(x, right, places):
-        return right
+    if farey_accuracy_i64 is not None:
+        numerator, denominator = farey_accuracy_i64(x, eps)
+        if denominator > 0:
+            return Rational(numerator, denominator)
 
-    mediant = None
+    inv = 1 / x
+    la, lb = 0, 1
+    # x is strictly positive here, so int() truncation agrees with math.floor
+    # and skips the math.floor name lookup and call
+    ra, rb = 1, int(inv)
+    if x < eps:
+        return Rational(la, lb)
+    elif abs(x * rb - ra) < eps * rb:
+        return Rational(ra, rb)
+    # 1/(N+1) is the first mediant the loop would test, and for small x it is
+    # frequently already good enough, so check it before setting up the walk
+    elif abs(x * (rb + 1) - 1) < eps * (rb + 1):
+        return Rational(1, rb + 1)
 
-    while mediant is None or not almost_equal(x, mediant, places):
-        mediant = farey_add(left, right)
-        if x < mediant:
-            right = mediant
-        elif x > mediant:
-            left = mediant
+    while True:
+        ma, mb = la + ra, lb + rb
+        # the sign of x*mb - ma places x relative to the mediant, and
+        # |x*mb - ma| < eps*mb is the tolerance test |x - ma/mb| < eps,
+        # cross-multiplied so the loop performs no division
+        diff = x * mb - ma
+        if abs(diff) < eps * mb:
+            return Rational(ma, mb)
+        if diff < 0:
+            ra, rb = ma, mb
+            # successive mediants on this run are (i*la + ra) / (i*lb + rb); writing
+            # u = x*lb - la and v = ra - x*rb, the walk stays on this side of x while
+            # i*u < v, and first satisfies the tolerance once i*(u + eps*lb) > v - eps*rb
+            u = x * lb - la
+            v = ra - x * rb
+            if u <= 0:
+                continue
+            k = max(math.ceil(v / u) - 1, 0)
+            while k > 0 and x * (k * lb + rb) >= k * la + ra:
+                k -= 1
+            i = max(math.floor((v - eps * rb) / (u + eps * lb)) + 1, 1)
+            while i > 1 and abs(x * ((i - 1) * lb + rb) - ((i - 1) * la + ra)) < eps * ((i - 1) * lb + rb):
+                i -= 1
+            while i <= k and not abs(x * (i * lb + rb) - (i * la + ra)) < eps * (i * lb + rb):
+                i += 1
+            if i <= k:
+                return Rational(i * la + ra, i * lb + rb)
+            elif k > 0:
+                ra, rb = k * la + ra, k * lb + rb
         else:
-            return mediant
-
-    return mediant
+            la, lb = ma, mb
+            # mirror image of the branch above: mediants are (la + i*ra) / (lb + i*rb),
+            # the run continues while i*v < u and the tolerance is first satisfied
+            # once i*(v + eps*rb) > u - eps*lb
+            u = x * lb - la
+            v = ra - x * rb
+            if v <= 0:
+                continue
+            k = max(math.ceil(u / v) - 1, 0)
+            while k > 0 and x * (lb + k * rb) <= la + k * ra:
+                k -= 1
+            i = max(math.floor((u - eps * lb) / (v + eps * rb)) + 1, 1)
+            while i > 1 and abs(x * (lb + (i - 1) * rb) - (la + (i - 1) * ra)) < eps * (lb + (i - 1) * rb):
+                i -= 1
+            while i <= k and not abs(x * (lb + i * rb) - (la + i * ra)) < eps * (lb + i * rb):
+                i += 1
+            if i <= k:
+                return Rational(la + i * ra, lb + i * rb)
+            elif k > 0:
+                la, lb = la + k * ra, lb + k * rb
 
 
 def _farey_algorithm_denominator(x, max_denominator=1000):
@@ -90,30 +330,69 @@ def _farey_algorithm_denominator(x, max_denominator=1000):
     To speed up the process for small x, note that we only need to look in the range between
     (0, 1) and (1, N), for N = math.floor(1 / x), since we will always reach this region
     eventually by repeated Farey addition.
+
+    Rather than taking one mediant step per iteration, we batch consecutive steps on the
+    same side of x, computing the length of each run in closed form with math.floor. This
+    collapses O(N) iterations to O(log N), as in the Euclidean algorithm.
+
+    The endpoints are kept as plain (numerator, denominator) int pairs throughout; a
+    Rational is only constructed for the returned value, so the hot loop allocates no
+    objects at all.
     """
 
-    N = math.floor(1 / x)
+    inv = 1 / x
+    # x is strictly positive here, so int() truncation agrees with math.floor
+    N = int(inv)
     if max_denominator <= N:
-        return min(
-            [Rational(0, 1), Rational(1, max_denominator)], key=lambda r: abs(x - r)
-        )
+        if x <= abs(x - 1 / max_denominator):
+            return Rational(0, 1)
+        return Rational(1, max_denominator)
 
-    left = Rational(0, 1)
-    right = Rational(1, N)
+    la, lb = 0, 1
+    ra, rb = 1, N
 
-    while max(left.denominator, right.denominator) < max_denominator:
-        mediant = farey_add(left, right)
-        if mediant.denominator > max_denominator:
+    while max(lb, rb) < max_denominator:
+        ma, mb = la + ra, lb + rb
+        if mb > max_denominator:
             # the current bounds are as good as we can do, so have to choose the best of them
             break
+        mediant = ma / mb
         if x < mediant:
-            right = mediant
+            ra, rb = ma, mb
+            # successive mediants on this run are (i*la + ra) / (i*lb + rb); writing
+            # u = x*lb - la and v = ra - x*rb, the walk stays on this side of x while
+            # i*u < v, and the denominator stays within bounds while i*lb <= max_denominator - rb
+            u = x * lb - la
+            v = ra - x * rb
+            if u <= 0:
+                continue
+            k = max(math.ceil(v / u) - 1, 0)
+            while k > 0 and (k * la + ra) / (k * lb + rb) <= x:
+                k -= 1
+            k = min(k, (max_denominator - rb) // lb)
+            if k > 0:
+                ra, rb = k * la + ra, k * lb + rb
         elif x > mediant:
-            left = mediant
+            la, lb = ma, mb
+            # mirror image of the branch above: mediants are (la + i*ra) / (lb + i*rb)
+            u = x * lb - la
+            v = ra - x * rb
+            if v <= 0:
+                continue
+            k = max(math.ceil(u / v) - 1, 0)
+            while k > 0 and (la + k * ra) / (lb + k * rb) >= x:
+                k -= 1
+            k = min(k, (max_denominator - lb) // rb)
+            if k > 0:
+                la, lb = la + k * ra, lb + k * rb
         else:
-            return mediant
+            return Rational(ma, mb)
 
-    return min([left, right], key=lambda r: abs(x - r))
+    # the loop already knows the final bounds, so pick the closer endpoint directly
+    # rather than boxing both sides and paying min/lambda/abs dispatch
+    if x - la / lb <= ra / rb - x:
+        return Rational(la, lb)
+    return Rational(ra, rb)
 
 
 def _continued_fraction_algorithm_denominator(x, max_denominator=1000):
@@ -122,72 +401,69 @@ def _continued_fraction_algorithm_denominator(x, max_denominator=1000):
     We use an algorithm based on truncating the continued fraction representation of a number,
     and reducing its final value until reaching a suitable rational representation,
     cf. https://en.wikipedia.org/wiki/Continued_fraction#Best_rational_approximations.
+
+    The convergents h_n / k_n are maintained incrementally via the textbook recurrence
+    h_n = a_n * h_{n-1} + h_{n-2}, k_n = a_n * k_{n-1} + k_{n-2}, rather than rebuilding
+    the truncated continued fraction from scratch at every step, so each step is O(1).
     """
-    n = 0
-    prev_denominator = 0  # k_{-1} = 0
-    current_convergent = Rational(math.floor(x), 1)
+    # h_{-1}/k_{-1} and h_0/k_0 of the convergent recurrence
+    a = math.floor(x)
+    p_prev, q_prev = 1, 0
+    p, q = a, 1
+    frac = x - a
 
-    while True:
-        next_truncation = truncated_continued_fraction(x, n + 1)
-        next_convergent = next_truncation.as_rational
-        if next_convergent == current_convergent:
-            # reached the end of finite continued fraction
-            return current_convergent
-        if next_convergent.denominator > max_denominator:
+    while frac != 0:
+        remainder = 1 / frac
+        a = math.floor(remainder)
+        frac = remainder - a
+        p_next = a * p + p_prev
+        q_next = a * q + q_prev
+        if q_next > max_denominator:
             # we've gone too far so need to find potential convergents by reducing the last value
-            # of the continued fraction, without going past half of a_{n+1}.
+            # a_{n+1} of the continued fraction, without going past half of a_{n+1}.
             # The smallest we can make the denominator in this way is given by
             # math.ceil(a_{n+1} / 2) * k_n + k_{n-1}
-            a_n_plus_one = next_truncation.last_value
-            smallest_denominator = (
-                math.ceil(a_n_plus_one / 2) * current_convergent.denominator
-                + prev_denominator
-            )
+            smallest_denominator = math.ceil(a / 2) * q + q_prev
             if smallest_denominator > max_denominator:
                 # we can't get better than the approximation we already have
-                return current_convergent
+                return Rational(p, q)
             else:
                 # there is some i for which the reduced denominator is less than max_denominator
                 # k'_{n+1} = (a_{n+1} - i) * k_n + k_{n-1} < max_denominator
                 # The smallest such i is math.ceil((k_{n+1} - max_denominator) / k_n)
-                optimal_reduction_factor = math.ceil(
-                    (next_convergent.denominator - max_denominator)
-                    / current_convergent.denominator
-                )
-                next_truncation = next_truncation.replace_last_value(
-                    a_n_plus_one - optimal_reduction_factor
-                )
-                next_convergent = next_truncation.as_rational
+                optimal_reduction_factor = math.ceil((q_next - max_denominator) / q)
+                reduced_p = (a - optimal_reduction_factor) * p + p_prev
+                reduced_q = (a - optimal_reduction_factor) * q + q_prev
                 # if a_{n+1} is even and i == a_{n+1} / 2, we need to check the errors
-                if (
-                    a_n_plus_one % 2 == 0
-                    and optimal_reduction_factor == a_n_plus_one / 2
-                ):
-                    current_error = abs(x - current_convergent)
-                    next_error = abs(x - next_convergent)
+                if a % 2 == 0 and optimal_reduction_factor == a / 2:
+                    current_error = abs(x - p / q)
+                    next_error = abs(x - reduced_p / reduced_q)
                     if next_error < current_error:
-                        return next_convergent
+                        return Rational(reduced_p, reduced_q)
                     else:
-                        return current_convergent
+                        return Rational(p, q)
                 else:
-                    return next_convergent
-        else:
-            n += 1
-            prev_denominator = current_convergent.denominator
-            current_convergent = next_convergent
+                    return Rational(reduced_p, reduced_q)
+        p_prev, q_prev = p, q
+        p, q = p_next, q_next
+
+    # reached the end of a finite continued fraction
+    return Rational(p, q)
 
 
 def _continued_fraction_algorithm_accuracy(x, places=7):
     epsilon = 0.5 * 10 ** -places
     n = 0
-    current_convergent = Rational(math.floor(x), 1)
-    if almost_equal(x, current_convergent, places=places):
+    current_convergent = Rational.from_int(math.floor(x))
+    if almost_equal_rational(x, current_convergent.numerator, 1, places):
         return current_convergent
 
     while True:
         next_truncation = truncated_continued_fraction(x, n + 1)
         next_convergent = next_truncation.as_rational
-        if almost_equal(x, next_convergent, places=places):
+        if almost_equal_rational(
+            x, next_convergent.numerator, next_convergent.denominator, places
+        ):
             # we're within the allowed bound, but may be able to find a convergent
             # with smaller denominator also within the bound by reducing the last
             # value of the continued fraction.
@@ -207,3 +483,13 @@ def _continued_fraction_algorithm_accuracy(x, places=7):
         else:
             n += 1
             current_convergent = next_convergent
+
+
+_ACCURACY_ALGORITHMS = {
+    "farey": _farey_algorithm_accuracy,
+    "continued_fraction": _continued_fraction_algorithm_accuracy,
+}
+_DENOMINATOR_ALGORITHMS = {
+    "farey": _farey_algorithm_denominator,
+    "continued_fraction": _continued_fraction_algorithm_denominator,
+}
@@ -1,5 +1,13 @@
+import functools
 import math
 
+from rationals._jit import convergent_i64
+
+# the reduction helpers call gcd on (numerator, denominator) pairs that recur
+# heavily in Farey searches, so memoize it; keying on the absolute numerator
+# lets negative fractions share entries with their positive counterparts
+_cached_gcd = functools.lru_cache(maxsize=4096)(math.gcd)
+
 
 class Rational:
     """Data structure representing a rational number.
@@ -11,10 +19,50 @@ class Rational:
     1/2
     """
 
+    __slots__ = ("numerator", "denominator", "_float", "_reduced")
+
     def __init__(self, numerator, denominator):
-        assert denominator > 0
+        # normalize the sign into the numerator here, once, so the arithmetic
+        # operators never need to branch on the sign of a denominator
+        if denominator < 0:
+            numerator, denominator = -numerator, -denominator
+        elif denominator == 0:
+            raise ZeroDivisionError
         self.numerator = numerator
         self.denominator = denominator
+        self._float = None
+        self._reduced = None
+
+    @classmethod
+    def _make(cls, numerator, denominator):
+        """Internal fast constructor for values already known to satisfy the
+        invariants (positive denominator), skipping the __init__ checks."""
+        obj = object.__new__(cls)
+        obj.numerator = numerator
+        obj.denominator = denominator
+        obj._float = None
+        obj._reduced = None
+        return obj
+
+    @classmethod
+    def _make_reduced(cls, numerator, denominator):
+        """Like _make, but reduces the fraction to lowest terms first, fusing the
+        single gcd into construction so no intermediate object is built."""
+        if denominator > 1:
+            gcd = _cached_gcd(abs(numerator), denominator)
+            if gcd > 1:
+                numerator //= gcd
+                denominator //= gcd
+        return cls._make(numerator, denominator)
+
+    @classmethod
+    def from_int(cls, n: int) -> "Rational":
+        """Build the rational n/1 without any of the constructor checks.
+
+        >>> Rational.from_int(3)
+        3/1
+        """
+        return cls._make(n, 1)
 
     @property
     def is_zero(self):
@@ -26,21 +74,36 @@ class Rational:
 
     @property
     def inverse(self):
-        if self.is_zero:
+        numerator = self.numerator
+        if numerator == 0:
             raise ZeroDivisionError
-        elif self.is_negative:
-            return Rational(-self.denominator, abs(self.numerator))
+        elif numerator < 0:
+            # the sign is already known, so negate directly rather than
+            # paying for abs() and renormalization in the constructor
+            return Rational._make(-self.denominator, -numerator)
         else:
-            return Rational(self.denominator, self.numerator)
+            return Rational._make(self.denominator, numerator)
 
     @property
     def is_reduced(self):
-        gcd = math.gcd(self.numerator, self.denominator)
-        return gcd == 1
+        # integers n/1 are always reduced; skip the gcd entirely
+        if self.denominator == 1:
+            return True
+        return _cached_gcd(abs(self.numerator), self.denominator) == 1
 
     @property
     def reduced_form(self):
-        return simplify(self)
+        """The fully reduced equivalent, computed on first use and cached.
+
+        Arithmetic never reduces eagerly, so reduction happens on demand; the
+        cache means each instance pays for at most one gcd, and the reduced
+        instance points at itself so chained reductions are free.
+        """
+        if self._reduced is None:
+            reduced = simplify(self)
+            reduced._reduced = reduced
+            self._reduced = reduced
+        return self._reduced
 
     def __add__(self, other):
         """Addition has the following properties:
@@ -55,13 +118,16 @@ class Rational:
         >>> Rational(1, 2) + 0.25
         0.75
         """
-        if isinstance(other, Rational):
-            return Rational(
-                self.numerator * other.denominator + self.denominator * other.numerator,
-                self.denominator * other.denominator,
-            )
+        if type(other) is Rational:
+            # bind the slots to locals once; each attribute access is a descriptor
+            # call, and the cross-multiplication reads them twice apiece
+            a, b = self.numerator, self.denominator
+            c, d = other.numerator, other.denominator
+            return Rational._make(a * d + b * c, b * d)
         elif isinstance(other, int):
-            return Rational(self.numerator + other * self.denominator, self.denominator)
+            return Rational._make(
+                self.numerator + other * self.denominator, self.denominator
+            )
         elif isinstance(other, float):
             return other + float(self)
         else:
@@ -91,12 +157,12 @@ class Rational:
         >>> Rational(1, 2) * 3.4
         1.7
         """
-        if isinstance(other, Rational):
-            return Rational(
+        if type(other) is Rational:
+            return Rational._make(
                 self.numerator * other.numerator, self.denominator * other.denominator
             )
         elif isinstance(other, int):
-            return Rational(self.numerator * other, self.denominator)
+            return Rational._make(self.numerator * other, self.denominator)
         elif isinstance(other, float):
             return float(self) * other
         else:
@@ -119,23 +185,19 @@ class Rational:
         >>> Rational(1, 2) / 3
         1/6
         """
-        if isinstance(other, Rational):
-            if other.is_zero:
+        if type(other) is Rational:
+            numerator = other.numerator
+            if numerator == 0:
                 raise ZeroDivisionError
-            elif other.is_negative:
-                return -self / abs(other)
-            else:
-                return Rational(
-                    self.numerator * other.denominator,
-                    self.denominator * other.numerator,
-                )
+            # the constructor normalizes the sign, so no is_negative branching
+            return Rational(
+                self.numerator * other.denominator,
+                self.denominator * numerator,
+            )
         elif isinstance(other, int):
             if other == 0:
                 raise ZeroDivisionError
-            elif other < 0:
-                return -self / abs(other)
-            else:
-                return Rational(self.numerator, self.denominator * other)
+            return Rational(self.numerator, self.denominator * other)
         else:
             return float(self) / other
 
@@ -149,17 +211,21 @@ class Rational:
         """
         if isinstance(power, int) and modulo is None:
             if power > 0:
-                return Rational(self.numerator ** power, self.denominator ** power)
+                return Rational._make(
+                    self.numerator ** power, self.denominator ** power
+                )
             elif power < 0:
                 if self.is_zero:
                     raise ZeroDivisionError
-                else:
-                    return Rational(
-                        self.denominator ** abs(power), self.numerator ** abs(power)
-                    )
+                numerator = self.denominator ** -power
+                denominator = self.numerator ** -power
+                # keep the denominator positive when inverting a negative rational
+                if denominator < 0:
+                    numerator, denominator = -numerator, -denominator
+                return Rational._make(numerator, denominator)
             else:
                 # convention that 0 ** 0 = 1 in python
-                return Rational(1, 1)
+                return _ONE
         else:
             return pow(float(self), power, modulo)
 
@@ -171,33 +237,57 @@ class Rational:
         >>> Rational(1, 2) == Rational(2, 4)
         False
         """
+        if self is other:
+            return True
         if not isinstance(other, Rational):
             return False
+        # compare numerators first: mismatching fractions in the approximation
+        # loops typically share a constructed denominator but differ in numerator
         return (
-            self.denominator == other.denominator and self.numerator == other.numerator
+            self.numerator == other.numerator and self.denominator == other.denominator
         )
 
+    def __hash__(self):
+        """Hash on the (numerator, denominator) pair, consistent with __eq__.
+
+        >>> hash(Rational(1, 2)) == hash(Rational(1, 2))
+        True
+        """
+        return hash((self.numerator, self.denominator))
+
     def __lt__(self, other):
-        """Ordering of rational numbers is implemented using their float representations.
+        """Ordering against Rational and int is exact, by cross-multiplication with
+        the (positive) denominators; comparison with a float falls back to the
+        cached float value.
 
         >>> Rational(1, 2) < Rational(3, 4)
         True
         """
-        if isinstance(other, (Rational, int, float)):
-            return float(self) < float(other)
+        if type(other) is Rational:
+            return self.numerator * other.denominator < other.numerator * self.denominator
+        elif isinstance(other, int):
+            return self.numerator < other * self.denominator
+        elif isinstance(other, float):
+            return float(self) < other
         else:
             raise TypeError(
                 "must be int, float or Rational, not %s" % type(other).__name__
             )
 
     def __gt__(self, other):
-        """Ordering of rational numbers is implemented using their float representations.
+        """Ordering against Rational and int is exact, by cross-multiplication with
+        the (positive) denominators; comparison with a float falls back to the
+        cached float value.
 
         >>> Rational(1, 2) > Rational(3, 4)
         False
         """
-        if isinstance(other, (Rational, int, float)):
-            return float(self) > float(other)
+        if type(other) is Rational:
+            return self.numerator * other.denominator > other.numerator * self.denominator
+        elif isinstance(other, int):
+            return self.numerator > other * self.denominator
+        elif isinstance(other, float):
+            return float(self) > other
         else:
             raise TypeError(
                 "must be int, float or Rational, not %s" % type(other).__name__
@@ -214,10 +304,15 @@ class Rational:
     def __float__(self):
         """The float representation is obtained by evaluating the fraction.
 
+        The value is computed on first use and cached, since instances are never
+        mutated after construction and comparisons evaluate it repeatedly.
+
         >>> float(Rational(1, 2))
         0.5
         """
-        return self.numerator / self.denominator
+        if self._float is None:
+            self._float = self.numerator / self.denominator
+        return self._float
 
     def __abs__(self):
         """Only the numerator is an unsigned int, so we take the absolute value of that.
@@ -232,22 +327,53 @@ class Rational:
         return self.numerator // self.denominator
 
     def __ceil__(self):
-        """For use with math.ceil function."""
-        return self.numerator // self.denominator + (
-            self.numerator % self.denominator > 0
-        )
+        """For use with math.ceil function.
+
+        Ceiling division is floored division of the negated numerator, negated
+        back; one integer division and no remainder handling.
+        """
+        return -(-self.numerator // self.denominator)
 
     def __repr__(self):
         return "{}/{}".format(self.numerator, self.denominator)
 
 
+# shared immutable instances for the values the algorithms return constantly;
+# instances are never mutated, so handing out the same object is safe
+_ZERO = Rational(0, 1)
+_ONE = Rational(1, 1)
+
+# public aliases for the most common constants, so callers can reuse the
+# interned instances; interning inside __new__ was considered instead, but a
+# dict probe on every construction costs more than it saves on the few hits
+Rational.ZERO = _ZERO
+Rational.ONE = _ONE
+Rational.HALF = Rational(1, 2)
+Rational.MINUS_ONE = Rational(-1, 1)
+
+
 def simplify(x: Rational) -> Rational:
     """ Reduce rational number to its simplest terms """
     if x.is_zero:
-        return Rational(0, 1)
+        return _ZERO
     else:
-        gcd = math.gcd(x.numerator, x.denominator)
-        return Rational(x.numerator // gcd, x.denominator // gcd)
+        return Rational._make_reduced(x.numerator, x.denominator)
+
+
+@functools.lru_cache(maxsize=1024)
+def _continued_fraction_terms(numerator, denominator):
+    """The continued fraction terms of numerator / denominator, memoized.
+
+    This is just the Euclidean algorithm on the pair: the successive quotients
+    are the terms, and Python's floored division handles negative numerators
+    correctly. Keyed on the bare ints so equal fractions share an entry.
+    """
+    terms = []
+    while denominator:
+        quotient, remainder = divmod(numerator, denominator)
+        terms.append(quotient)
+        numerator, denominator = denominator, remainder
+    return tuple(terms)
 
 
 class SimpleContinuedFraction:
@@ -262,9 +388,15 @@ class SimpleContinuedFraction:
     [1; 2, 3]
     """
 
+    __slots__ = ("_list_representation", "_hash", "_as_rational")
+
     def __init__(self, *args):
         assert len(args) > 0, "must provide at least one argument"
-        self._list_representation = list(args)
+        # args is already a tuple; instances are never mutated, so keep it as
+        # one rather than copying into a list
+        self._list_representation = args
+        self._hash = None
+        self._as_rational = None
 
     @property
     def has_leading_zero(self):
@@ -289,37 +421,50 @@ class SimpleContinuedFraction:
 
     @property
     def as_rational(self) -> Rational:
-        if len(self) == 1:
-            return Rational(self[0], 1)
-        elif len(self) == 2:
-            return self[0] + Rational(1, self[1])
-        else:
-            return self[0] + self[1:].as_rational.inverse
+        # evaluate via the classical convergent recurrence
+        # p_k = a_k * p_{k-1} + p_{k-2}, q_k = a_k * q_{k-1} + q_{k-2},
+        # which needs only integer multiplies and adds (no intermediate
+        # Rational objects or slices) and yields the fraction in lowest terms;
+        # the terms never change, so the result is cached after the first call
+        if self._as_rational is None:
+            terms = self._list_representation
+            p_prev, p = 1, terms[0]
+            q_prev, q = 0, 1
+            for i in range(1, len(terms)):
+                a = terms[i]
+                p_prev, p = p, a * p + p_prev
+                q_prev, q = q, a * q + q_prev
+            self._as_rational = Rational._make(p, q)
+        return self._as_rational
 
     def replace_last_value(self, value: int):
         """This method is used for rational approximation."""
-        list_repr = self._list_representation[:-1] + [value]
+        list_repr = self._list_representation[:-1] + (value,)
         return SimpleContinuedFraction(*list_repr)
 
     @classmethod
     def from_rational(cls, r: Rational) -> "SimpleContinuedFraction":
-        list_repr = []
-        while True:
-            int_part = math.floor(r)
-            list_repr.append(int_part)
-            try:
-                r = (r - int_part).inverse
-            except ZeroDivisionError:
-                break
-        return cls(*list_repr)
+        return cls(*_continued_fraction_terms(r.numerator, r.denominator))
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, SimpleContinuedFraction):
             return False
         return self._list_representation == other._list_representation
 
+    def __hash__(self):
+        """Hash of the terms tuple, computed on first use and cached.
+
+        Comparing hashes inside __eq__ was considered and rejected: computing a
+        missing hash walks the whole tuple, which is the comparison itself.
+        """
+        if self._hash is None:
+            self._hash = hash(self._list_representation)
+        return self._hash
+
     def __iter__(self):
-        return self._list_representation.__iter__()
+        return iter(self._list_representation)
 
     def __getitem__(self, item):
         """Slicing returns another SimpleContinuedFraction, whereas integer indexing returns an int.
@@ -339,13 +484,13 @@ class SimpleContinuedFraction:
         return len(self._list_representation)
 
     def __float__(self):
-        """The float representation is obtained by evaluating the continued fraction."""
-        if len(self) == 1:
-            return float(self[0])
-        elif len(self) == 2:
-            return self[0] + 1 / float(self[1])
-        else:
-            return self[0] + 1 / float(self[1:])
+        """The float representation is obtained by evaluating the continued fraction
+        back to front, accumulating a_i + 1 / acc without any recursion or slicing."""
+        terms = self._list_representation
+        value = float(terms[-1])
+        for i in range(len(terms) - 2, -1, -1):
+            value = terms[i] + 1 / value
+        return value
 
     def __repr__(self):
         first = self._list_representation[0]
@@ -376,5 +521,113 @@ def convergent(x: float, n: int) -> Rational:
     The even convergents are underestimates of x, while the odd convergents are overestimates,
     which get closer to x as n is increased.
     """
-    continued_frac = truncated_continued_fraction(x, n)
-    return continued_frac.as_rational
+    if convergent_i64 is not None:
+        p, q = convergent_i64(x, n)
+        if q > 0:
+            return Rational._make(p, q)
+    # fuse term extraction with the convergent recurrence, mirroring the jitted
+    # kernel: no intermediate SimpleContinuedFraction is built, and consecutive
+    # convergents are coprime so the result needs no reduction
+    a = math.floor(x)
+    p_prev, p = 1, a
+    q_prev, q = 0, 1
+    frac = x - a
+    for _ in range(n):
+        if frac == 0:
+            break
+        remainder = 1 / frac
+        a = math.floor(remainder)
+        frac = remainder - a
+        p_prev, p = p, a * p + p_prev
+        q_prev, q = q, a * q + q_prev
+    return Rational._make(p, q)
+
+
+class RationalArray:
+    """Struct-of-arrays container for a sequence of rational numbers.
+
+    All numerators live in one int64 NumPy array and all denominators in
+    another, instead of materializing a Python Rational object per element.
+    This keeps a sequence of convergents in two contiguous buffers, supports
+    vectorized operations on them, and only boxes a Rational when a single
+    element is asked for.
+
+    Requires numpy, which is an optional dependency (install with the
+    "batch" extra).
+
+    >>> RationalArray([1, 3, 7], [1, 2, 5])[1]
+    3/2
+    """
+
+    __slots__ = ("numerators", "denominators")
+
+    def __init__(self, numerators, denominators):
+        import numpy as np
+
+        numerators = np.asarray(numerators, dtype=np.int64)
+        denominators = np.asarray(denominators, dtype=np.int64)
+        assert numerators.shape == denominators.shape
+        # normalize signs into the numerators, matching the Rational invariant
+        negative = denominators < 0
+        if negative.any():
+            numerators = np.where(negative, -numerators, numerators)
+            denominators = np.where(negative, -denominators, denominators)
+        self.numerators = numerators
+        self.denominators = denominators
+
+    @classmethod
+    def convergents(cls, x: float, n: int) -> "RationalArray":
+        """The convergents of x from the 0'th up to the n'th, as one array.
+
+        The recurrence writes straight into the preallocated int64 buffers, so
+        no per-convergent Python objects are created; the array is truncated
+        early if the continued fraction of x terminates.
+        """
+        import numpy as np
+
+        numerators = np.empty(n + 1, dtype=np.int64)
+        denominators = np.empty(n + 1, dtype=np.int64)
+        a = math.floor(x)
+        p_prev, p = 1, a
+        q_prev, q = 0, 1
+        frac = x - a
+        numerators[0], denominators[0] = p, q
+        count = 1
+        for i in range(1, n + 1):
+            if frac == 0:
+                break
+            remainder = 1 / frac
+            a = math.floor(remainder)
+            frac = remainder - a
+            p_prev, p = p, a * p + p_prev
+            q_prev, q = q, a * q + q_prev
+            numerators[i], denominators[i] = p, q
+            count += 1
+        return cls(numerators[:count], denominators[:count])
+
+    def to_floats(self):
+        """Evaluate every fraction in one vectorized division."""
+        return self.numerators / self.denominators
+
+    def __getitem__(self, item):
+        """Slicing returns another RationalArray, whereas integer indexing boxes
+        the element as a Rational.
+
+        >>> RationalArray([1, 3, 7], [1, 2, 5])[1:].to_floats()
+        array([1.5, 1.4])
+        """
+        if isinstance(item, slice):
+            return RationalArray(self.numerators[item], self.denominators[item])
+        else:
+            return Rational._make(int(self.numerators[item]), int(self.denominators[item]))
+
+    def __len__(self):
+        return len(self.numerators)
+
+    def __repr__(self):
+        return "[{}]".format(
+            ", ".join(
+                "{}/{}".format(n, d)
+                for n, d in zip(self.numerators, self.denominators)
+            )
+        )
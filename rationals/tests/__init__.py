@@ -5,6 +5,5 @@ def assert_almost_equal(a, b, places=7, message=None):
     """
     Fail if numbers `a` and `b` are not close enough
     """
-    if message is None:
-        message = f"{a} !~= {b} to {places} places"
-    assert almost_equal(a, b, places), message
+    if not almost_equal(a, b, places):
+        raise AssertionError(message or f"{a} !~= {b} to {places} places")
@@ -2,7 +2,11 @@ import math
 
 from pytest import raises
 
-from rationals.approximation import ALLOWED_METHODS, best_rational_approximation
+from rationals.approximation import (
+    ALLOWED_METHODS,
+    best_rational_approximation,
+    best_rational_approximation_batch,
+)
 from rationals.data import Rational
 from rationals.tests import assert_almost_equal
 
@@ -155,3 +159,35 @@ def test_continued_fraction_method_full_coverage():
     # indeed [1; 10, 6] = 67/61, [1; 10, 5] = 56/51, [1; 10, 4] = 45/41
     # since the last value is odd, we don't need to check the error so 45/41 is our best approx.
     assert r3 == Rational(45, 41)
+
+
+def test_batch_approximation_matches_scalar():
+    # one value from each region of the argument reduction: negative, greater
+    # than one, between one half and one, near zero, and exactly zero
+    xs = [
+        math.sqrt(2) - 1,
+        1 - math.sqrt(3),
+        math.sqrt(3) - 1,
+        math.sqrt(17),
+        0.000000001,
+        0.5,
+        0.4,
+        -2.25,
+        0,
+    ]
+    numerators, denominators = best_rational_approximation_batch(xs, places=7)
+    for x, numerator, denominator in zip(xs, numerators, denominators):
+        expected = best_rational_approximation(x, method="farey", places=7)
+        assert Rational(int(numerator), int(denominator)) == expected
+        assert_almost_equal(x, int(numerator) / int(denominator), places=7)
+
+
+def test_batch_approximation_long_run():
+    # x just below 1/3 forces a very long same-side run of mediant steps; the
+    # closed-form run collapsing must terminate quickly and still agree with
+    # the scalar walk element by element
+    x = 1 / 3 - 6e-8
+    numerators, denominators = best_rational_approximation_batch([x, 0.3], places=7)
+    expected = best_rational_approximation(x, method="farey", places=7)
+    assert Rational(int(numerators[0]), int(denominators[0])) == expected
+    assert Rational(int(numerators[1]), int(denominators[1])) == Rational(3, 10)
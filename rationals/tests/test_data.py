@@ -5,6 +5,7 @@ from pytest import raises
 from rationals.data import (
     convergent,
     Rational,
+    RationalArray,
     SimpleContinuedFraction,
     truncated_continued_fraction,
 )
@@ -21,6 +22,14 @@ def test_rational_zero():
         _ = x.inverse
 
 
+def test_rational_from_int():
+    x = Rational.from_int(3)
+    assert x == Rational(3, 1)
+    assert x.is_reduced
+
+    assert Rational.from_int(-2) == Rational(-2, 1)
+
+
 def test_rational_addition():
     x = Rational(1, 2)  # 1/2
     y = Rational(3, 5)  # 3/5
@@ -110,6 +119,22 @@ def test_rational_comparison():
     assert str(excinfo.value) == "must be int, float or Rational, not str"
 
 
+def test_rational_hash():
+    # equal fractions hash equal, including unreduced ones
+    assert hash(Rational(2, 4)) == hash(Rational(2, 4))
+
+    # 1/2 and 2/4 are distinct values under this class's strict equality,
+    # so they must act as distinct dict keys
+    counts = {Rational(1, 2): "half", Rational(2, 4): "two quarters"}
+    assert counts[Rational(1, 2)] == "half"
+    assert counts[Rational(2, 4)] == "two quarters"
+
+    # set round-trip
+    values = {Rational(1, 2), Rational(2, 4), Rational(1, 2)}
+    assert len(values) == 2
+    assert Rational(1, 2) in values and Rational(2, 4) in values
+
+
 def test_rational_negative():
     x = Rational(1, 2)
     neg_x = -x
@@ -235,3 +260,41 @@ def test_convergent():
     x = 0.5  # [0; 2]
     assert truncated_continued_fraction(x, 3) == SimpleContinuedFraction(0, 2)
     assert convergent(x, 3) == SimpleContinuedFraction(0, 2).as_rational
+
+
+# -------------------------------------------
+# RationalArray
+# -------------------------------------------
+
+
+def test_rational_array_sign_normalization():
+    arr = RationalArray([1, -3], [1, -2])
+    # signs move into the numerators, matching the Rational invariant
+    assert arr[0] == Rational(1, 1)
+    assert arr[1] == Rational(3, 2)
+
+
+def test_rational_array_getitem():
+    arr = RationalArray([1, 3, 7], [1, 2, 5])
+    # integer indexing boxes a Rational
+    assert arr[1] == Rational(3, 2)
+    # slicing returns another RationalArray
+    tail = arr[1:]
+    assert isinstance(tail, RationalArray)
+    assert len(tail) == 2
+    assert tail[0] == Rational(3, 2)
+    assert tail[1] == Rational(7, 5)
+    assert list(arr.to_floats()) == [1.0, 1.5, 1.4]
+
+
+def test_rational_array_convergents():
+    x = math.sqrt(2)  # [1; 2, 2, 2, ...]
+    arr = RationalArray.convergents(x, 5)
+    assert len(arr) == 6
+    for n in range(6):
+        assert arr[n] == convergent(x, n)
+
+    # the expansion of 0.5 terminates after two terms, so the array is truncated
+    arr = RationalArray.convergents(0.5, 5)
+    assert len(arr) == 2
+    assert arr[1] == Rational(1, 2)
@@ -1,2 +1,12 @@
 def almost_equal(a, b, places=7):
     return a == b or abs(a - b) < 0.5 * 10 ** -places
+
+
+def almost_equal_rational(x, numerator, denominator, places=7):
+    """Test whether x is within the `places` tolerance of numerator / denominator.
+
+    Equivalent to almost_equal(x, numerator / denominator, places), with the
+    comparison cross-multiplied by the (positive) denominator so the fraction
+    never has to be converted to float.
+    """
+    return abs(x * denominator - numerator) < 0.5 * 10 ** -places * denominator
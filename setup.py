@@ -22,6 +22,8 @@ setup(
     python_requires=">=3.6",
     extras_require={
         "formatting": ["black", "flake8"],
+        "jit": ["numba"],
+        "batch": ["numpy"],
         "testing": ["pytest"],
         "coverage": ["pytest-cov"],
     },